@@ -1,9 +1,33 @@
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 
 load_dotenv()
 
+_log_listener = None
+
+def setup_logging(level: str = None):
+    """Route all log records through a queue so the event loop never blocks on stdout"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    root = logging.getLogger()
+    root.setLevel(level or os.getenv("LOG_LEVEL", "INFO").upper())
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 class Settings:
     def __init__(self):
         self.buzz_threshold = 200
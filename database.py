@@ -1,7 +1,12 @@
+import logging
 from datetime import datetime, timezone, timedelta
 from config import settings
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 500  # rows per Supabase request when scanning whole tables
+
 class Database:
     def __init__(self):
         self.client = None
@@ -11,33 +16,47 @@ class Database:
             try:
                 from supabase import create_client
                 self.client = create_client(settings.supabase_url, settings.supabase_key)
-                print("✅ Supabase connected")
+                logger.info("✅ Supabase connected")
                 self._load_realized_pnl()
                 self._load_open_positions()
             except Exception as e:
-                print(f"❌ Supabase error: {e}")
+                logger.error("❌ Supabase error: %s", e)
         else:
-            print("⚠️  Using in-memory storage")
+            logger.warning("⚠️  Using in-memory storage")
+    
+    def _iter_rows(self, make_query, order_by: str, page_size: int = PAGE_SIZE):
+        """
+        Yield rows page by page so large tables are neither truncated nor loaded in one response.
+        order_by must be a unique column; offset paging without a stable order can skip or repeat rows.
+        """
+        start = 0
+        while True:
+            page = make_query().order(order_by).range(start, start + page_size - 1).execute().data or []
+            yield from page
+            if len(page) < page_size:
+                break
+            start += page_size
     
     def _load_realized_pnl(self):
         if self.client:
             try:
-                result = self.client.table("trades").select("pnl_usd").execute()
-                if result.data:
-                    settings.realized_pnl = sum(t.get("pnl_usd", 0) or 0 for t in result.data)
+                rows = self._iter_rows(lambda: self.client.table("trades").select("pnl_usd"), order_by="id")
+                settings.realized_pnl = sum(t.get("pnl_usd", 0) or 0 for t in rows)
             except:
                 pass
     
     def _load_open_positions(self):
         if self.client:
             try:
-                result = self.client.table("positions").select("*").eq("status", "open").execute()
-                if result.data:
-                    for p in result.data:
+                positions = list(self._iter_rows(
+                    lambda: self.client.table("positions").select("*").eq("status", "open"), order_by="id"
+                ))
+                if positions:
+                    for p in positions:
                         if "signal_source" in p and p["signal_source"]:
                             p["signal"] = {"source": p["signal_source"]}
-                    self._memory["positions"] = result.data
-                    print(f"📊 Loaded {len(result.data)} open positions")
+                    self._memory["positions"] = positions
+                    logger.info("📊 Loaded %d open positions", len(positions))
             except:
                 pass
     
@@ -69,8 +88,14 @@ class Database:
         return self._memory.get("mentions", [])[-500:]
     
     async def save_signal(self, signal: dict):
-        signal["timestamp"] = self._now_iso()
-        self._memory["signals"].append(signal)
+        await self.save_signals_bulk([signal])
+    
+    async def save_signals_bulk(self, signals: list):
+        """Store a batch of signals with one timestamp and a single trim of the buffer"""
+        timestamp = self._now_iso()
+        for s in signals:
+            s["timestamp"] = timestamp
+        self._memory["signals"].extend(signals)
         self._memory["signals"] = self._memory["signals"][-100:]
     
     async def get_active_signals(self):
@@ -104,10 +129,10 @@ class Database:
                     "open_time": position["open_time"]
                 }).execute()
             except Exception as e:
-                print(f"DB position error: {e}")
+                logger.error("DB position error: %s", e)
         
         self._memory["positions"].append(position)
-        print(f"📝 Opened: {position['coin']} from {signal_source}")
+        logger.info("📝 Opened: %s from %s", position['coin'], signal_source)
     
     async def get_open_positions(self):
         positions = [p for p in self._memory["positions"] if p.get("status") == "open"]
@@ -167,7 +192,7 @@ class Database:
                 pass
         
         self._memory["trades"].append(trade)
-        print(f"📝 Closed: {coin} | PnL: {pnl_percent:+.1f}%")
+        logger.info("📝 Closed: %s | PnL: %+.1f%%", coin, pnl_percent)
         return trade
     
     async def get_trade_history(self, limit: int = 50):
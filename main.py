@@ -1,4 +1,6 @@
 import asyncio
+import logging
+import math
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -6,11 +8,15 @@ from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from config import settings
+from config import settings, setup_logging
 from database import Database
 from services.trader import Trader
 from services.signals import SignalAggregator
 from services.dex_trader import dex_trader
+from services import http_client
+
+setup_logging()
+logger = logging.getLogger(__name__)
 
 db = Database()
 trader = Trader(db)
@@ -19,6 +25,10 @@ security = HTTPBearer(auto_error=False)
 
 latest_signals = []
 last_scan_time = None
+_settings_cache = None
+_history_cache = None  # {"data": [...], "limit": int, "timestamp": datetime}
+HISTORY_CACHE_SECONDS = 2
+HISTORY_FETCH_LIMIT = 100  # largest limit any dashboard endpoint asks for
 
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     return True
@@ -30,14 +40,14 @@ async def signal_scan_loop():
         try:
             latest_signals = await signals.get_all_signals()
             unique = {s["coin"]: s for s in latest_signals}
-            print(f"📊 {len(unique)} unique signals")
-            print(f"🎯 {len(latest_signals)} signals")
+            logger.info("📊 %d unique signals", len(unique))
+            logger.info("🎯 %d signals", len(latest_signals))
             
             await trader.process_signals(list(unique.values()))
             last_scan_time = datetime.now(timezone.utc)
             
         except Exception as e:
-            print(f"Signal scan error: {e}")
+            logger.error("Signal scan error: %s", e)
             settings.record_error(str(e))
         
         await asyncio.sleep(30)  # Scan for new signals every 30s
@@ -48,31 +58,35 @@ async def position_monitor_loop():
         try:
             await trader.check_exit_conditions_live()
         except Exception as e:
-            print(f"Position monitor error: {e}")
+            logger.error("Position monitor error: %s", e)
         
         await asyncio.sleep(5)  # Check positions every 5s
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # db already initializes in __init__
-    await dex_trader.initialize()
+    # Wallet sync only needs the address, so it overlaps with the CDP handshake
+    from services.wallet_sync import wallet_sync
+    sync_task = asyncio.create_task(wallet_sync.sync_positions(dex_trader.solana_address, db))
+    await dex_trader.ensure_initialized()
     
     # Start both loops
     asyncio.create_task(signal_scan_loop())
     asyncio.create_task(position_monitor_loop())
-    print("🚀 Trading loops started")
+    logger.info("🚀 Trading loops started")
     
     # Sync wallet on startup
-    from services.wallet_sync import wallet_sync
-    sync_result = await wallet_sync.sync_positions(dex_trader.solana_address, db)
+    sync_result = await sync_task
     if sync_result["synced"] > 0:
-        print(f'📥 Synced {sync_result["synced"]} orphan positions worth ${sync_result["total_orphan_value"]:.2f}')
-    print("🚀 Trading loops started (signals: 30s, positions: 5s)")
+        logger.info("📥 Synced %d orphan positions worth $%.2f", sync_result["synced"], sync_result["total_orphan_value"])
+    logger.info("🚀 Trading loops started (signals: 30s, positions: 5s)")
     
     yield
     
     if trader.session:
         await trader.session.close()
+    await dex_trader.close()
+    await http_client.close()
 
 app = FastAPI(title="CryptoCompass", lifespan=lifespan)
 
@@ -110,8 +124,9 @@ async def get_signals(user=Depends(verify_token)):
 @app.get("/positions")
 async def get_positions(user=Depends(verify_token)):
     positions = await db.get_open_positions()
+    prices = await trader.get_prices_bulk([pos["coin"] for pos in positions])
     for pos in positions:
-        price = await trader.get_current_price(pos["coin"])
+        price = prices.get(pos["coin"].upper().strip(), 0)
         if price and pos["buy_price"]:
             pos["current_price"] = price
             pos["pnl_percent"] = ((price - pos["buy_price"]) / pos["buy_price"]) * 100
@@ -122,14 +137,30 @@ async def get_positions(user=Depends(verify_token)):
             pos["volume_24h"] = data.get("volume_24h", 0)
     return positions
 
+async def get_cached_history(limit: int = 50) -> list:
+    """
+    Share one trade-history fetch between dashboard polls landing within a few
+    seconds. History is newest first, so every endpoint slices the same fetch.
+    """
+    global _history_cache
+    cached = _history_cache
+    if (cached and cached["limit"] >= limit
+            and (datetime.now(timezone.utc) - cached["timestamp"]).total_seconds() < HISTORY_CACHE_SECONDS):
+        return cached["data"][:limit]
+    
+    fetch_limit = max(limit, HISTORY_FETCH_LIMIT)
+    data = await db.get_trade_history(limit=fetch_limit)
+    _history_cache = {"data": data, "limit": fetch_limit, "timestamp": datetime.now(timezone.utc)}
+    return data[:limit]
+
 @app.get("/history")
 async def get_history(user=Depends(verify_token)):
-    return await db.get_trade_history(limit=50)
+    return await get_cached_history(limit=50)
 
 @app.get("/stats")
 async def get_stats(user=Depends(verify_token)):
     positions = await db.get_open_positions()
-    history = await db.get_trade_history(limit=100)
+    history = await get_cached_history(limit=100)
     
     total_pnl = sum(h.get("pnl_usd", 0) or 0 for h in history)
     wins = [h for h in history if (h.get("pnl_usd") or 0) > 0]
@@ -146,8 +177,9 @@ async def get_stats(user=Depends(verify_token)):
     
     # Calculate unrealized PnL
     unrealized_pnl = 0
+    prices = await trader.get_prices_bulk([p["coin"] for p in positions])
     for p in positions:
-        price = await trader.get_current_price(p["coin"])
+        price = prices.get(p["coin"].upper().strip(), 0)
         if price and p.get("buy_price"):
             unrealized_pnl += (price - p["buy_price"]) * p.get("quantity", 0)
     
@@ -167,9 +199,17 @@ async def get_stats(user=Depends(verify_token)):
         "max_positions": settings.max_open_positions
     }
 
+def invalidate_settings_cache():
+    global _settings_cache
+    _settings_cache = None
+
 @app.get("/settings")
 async def get_settings(user=Depends(verify_token)):
-    return {
+    global _settings_cache
+    if _settings_cache is not None:
+        return _settings_cache
+    
+    _settings_cache = {
         "take_profit_percent": settings.take_profit_percent,
         "stop_loss_percent": settings.stop_loss_percent,
         "max_position_usd": settings.max_position_usd,
@@ -187,12 +227,80 @@ async def get_settings(user=Depends(verify_token)):
         "cooldown_hours": settings.cooldown_hours,
         "max_daily_loss_usd": settings.max_daily_loss_usd
     }
+    return _settings_cache
+
+def _as_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes", "on"):
+            return True
+        if lowered in ("0", "false", "no", "off"):
+            return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+def _as_float(value) -> float:
+    if isinstance(value, bool):
+        raise ValueError(f"not a number: {value!r}")
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"not a finite number: {value!r}")
+    return number
+
+def _as_int(value) -> int:
+    number = _as_float(value)
+    if not number.is_integer():
+        raise ValueError(f"not an integer: {value!r}")
+    return int(number)
+
+# Settings the API may change, with the coercer applied to the incoming JSON value
+WRITABLE_SETTINGS = {
+    "buzz_threshold": _as_float,
+    "take_profit_percent": _as_float,
+    "stop_loss_percent": _as_float,
+    "live_trading": _as_bool,
+    "trading_enabled": _as_bool,
+    "starting_portfolio_usd": _as_float,
+    "max_open_positions": _as_int,
+    "use_ai_sizing": _as_bool,
+    "use_ai_smart_sell": _as_bool,
+    "min_position_usd": _as_float,
+    "max_position_usd": _as_float,
+    "min_market_cap": _as_float,
+    "max_market_cap": _as_float,
+    "min_liquidity": _as_float,
+    "min_volume_24h": _as_float,
+    "degen_enabled": _as_bool,
+    "degen_max_portfolio_percent": _as_float,
+    "degen_max_position_usd": _as_float,
+    "degen_min_market_cap": _as_float,
+    "degen_max_market_cap": _as_float,
+    "degen_take_profit": _as_float,
+    "degen_stop_loss": _as_float,
+    "cooldown_hours": _as_float,
+    "max_daily_loss_usd": _as_float,
+    "max_daily_loss_percent": _as_float,
+    "estimated_gas_per_trade": _as_float,
+}
 
 @app.post("/settings")
 async def update_settings(data: dict, user=Depends(verify_token)):
+    updates = {}
     for key, value in data.items():
-        if hasattr(settings, key):
-            setattr(settings, key, value)
+        coerce = WRITABLE_SETTINGS.get(key)
+        if coerce is None:
+            continue
+        try:
+            updates[key] = coerce(value)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail=f"Invalid value for {key}: {value!r}")
+    
+    for key, value in updates.items():
+        setattr(settings, key, value)
+    invalidate_settings_cache()
     return {"status": "updated"}
 
 @app.get("/trading/status")
@@ -207,21 +315,25 @@ async def trading_status(user=Depends(verify_token)):
 @app.post("/trading/go-live")
 async def go_live(user=Depends(verify_token)):
     settings.live_trading = True
+    invalidate_settings_cache()
     return {"status": "LIVE TRADING ENABLED", "live_trading": True}
 
 @app.post("/trading/paper")
 async def go_paper(user=Depends(verify_token)):
     settings.live_trading = False
+    invalidate_settings_cache()
     return {"status": "PAPER TRADING", "live_trading": False}
 
 @app.post("/trading/pause")
 async def pause_trading(user=Depends(verify_token)):
     settings.trading_enabled = False
+    invalidate_settings_cache()
     return {"status": "paused"}
 
 @app.post("/trading/resume")
 async def resume_trading(user=Depends(verify_token)):
     settings.trading_enabled = True
+    invalidate_settings_cache()
     return {"status": "resumed"}
 
 @app.get("/blacklist")
@@ -255,15 +367,24 @@ async def get_dex_status(user=Depends(verify_token)):
 @app.get("/ai-insights")
 async def get_ai_insights(user=Depends(verify_token)):
     positions = await db.get_open_positions()
+    if not positions:
+        return []
+    
+    datas = await asyncio.gather(
+        *(trader.get_token_data(pos["coin"]) for pos in positions),
+        return_exceptions=True
+    )
+    position_high = trader.position_highs.get
     insights = []
     
-    for pos in positions:
-        data = await trader.get_token_data(pos["coin"])
+    for pos, data in zip(positions, datas):
+        if isinstance(data, Exception):
+            continue
         price = data["price"]
         if price and pos["buy_price"]:
             pnl = ((price - pos["buy_price"]) / pos["buy_price"]) * 100
             
-            peak = trader.position_highs.get(pos["coin"], pnl)
+            peak = position_high(pos["coin"], pnl)
             
             insights.append({
                 "coin": pos["coin"],
@@ -326,13 +447,15 @@ async def sell_orphans(user=Depends(verify_token)):
         "total_recovered": 0
     }
     
+    token_values = await wallet_sync.get_token_values([t["contract_address"] for t in tokens])
+    
     for token in tokens:
         contract = token["contract_address"]
         symbol = token["symbol"]
         amount = token["amount"]
         
         # Get value info
-        value_info = await wallet_sync.get_token_value(contract)
+        value_info = token_values[contract]
         
         if value_info["price"] <= 0:
             results["failed"].append({"symbol": symbol, "reason": "No price data"})
@@ -349,7 +472,7 @@ async def sell_orphans(user=Depends(verify_token)):
             continue
         
         results["attempted"] += 1
-        print(f"🔄 Selling orphan: {symbol} (${value_usd:.2f})")
+        logger.info("🔄 Selling orphan: %s ($%.2f)", symbol, value_usd)
         
         # Try to sell
         result = await dex_trader.swap_token_to_usdc(contract)
@@ -361,7 +484,7 @@ async def sell_orphans(user=Depends(verify_token)):
                 "tx": result.get("tx_hash", "")
             })
             results["total_recovered"] += value_usd
-            print(f"✅ Sold {symbol} for ~${value_usd:.2f}")
+            logger.info("✅ Sold %s for ~$%.2f", symbol, value_usd)
             
             # Close position if exists
             await db.close_position(symbol, value_info["price"], "Orphan cleanup")
@@ -370,7 +493,7 @@ async def sell_orphans(user=Depends(verify_token)):
                 "symbol": symbol,
                 "reason": result.get("error", "Unknown error")
             })
-            print(f"❌ Failed to sell {symbol}: {result.get('error')}")
+            logger.error("❌ Failed to sell %s: %s", symbol, result.get("error"))
     
     return results
 
@@ -385,8 +508,10 @@ async def get_wallet_holdings(user=Depends(verify_token)):
     holdings = []
     total_value = 0
     
+    token_values = await wallet_sync.get_token_values([t["contract_address"] for t in tokens])
+    
     for token in tokens:
-        value_info = await wallet_sync.get_token_value(token["contract_address"])
+        value_info = token_values[token["contract_address"]]
         value_usd = token["amount"] * value_info["price"] if value_info["price"] > 0 else 0
         
         holdings.append({
@@ -421,12 +546,11 @@ async def get_portfolio_health(user=Depends(verify_token)):
     positions = await db.get_open_positions()
     
     # Calculate positions value
-    positions_value = 0
-    for pos in positions:
-        from services.trader import Trader
-        trader = Trader(db)
-        price = await trader.get_current_price(pos["coin"])
-        positions_value += price * pos.get("quantity", 0)
+    prices = await trader.get_prices_bulk([pos["coin"] for pos in positions])
+    positions_value = sum(
+        prices.get(pos["coin"].upper().strip(), 0) * pos.get("quantity", 0)
+        for pos in positions
+    )
     
     health = await portfolio_monitor.check_health(
         balances.get("sol", 0),
@@ -439,5 +563,5 @@ async def get_portfolio_health(user=Depends(verify_token)):
 @app.get("/portfolio/performance")
 async def get_performance(user=Depends(verify_token)):
     """Get trading performance summary"""
-    history = await db.get_trade_history()
+    history = await get_cached_history()
     return portfolio_monitor.get_performance_summary(history)
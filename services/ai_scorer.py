@@ -1,6 +1,9 @@
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 class AIScorer:
     """Multi-factor scoring with continuous learning"""
@@ -34,7 +37,7 @@ class AIScorer:
         trades = await self.db.get_trade_history(500)
         
         if len(trades) < 10:
-            print("📚 Not enough trades to learn from yet")
+            logger.info("📚 Not enough trades to learn from yet")
             return
         
         # Analyze by source
@@ -82,12 +85,14 @@ class AIScorer:
                 pass
         
         # Calculate win rates
-        print("📊 Learning from history:")
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("📊 Learning from history:")
         for source, data in self.source_performance.items():
             total = data["wins"] + data["losses"]
             if total > 0:
                 wr = data["wins"] / total * 100
-                print(f"   {source}: {wr:.0f}% win rate ({total} trades)")
+                logger.debug("   %s: %.0f%% win rate (%d trades)", source, wr, total)
     
     def get_source_multiplier(self, source: str) -> float:
         """Get performance multiplier for a source"""
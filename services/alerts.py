@@ -1,6 +1,9 @@
 import aiohttp
+import orjson
 import os
 from datetime import datetime, timezone
+from services import http_client
+from services.http_client import JSON_HEADERS
 
 class AlertService:
     def __init__(self):
@@ -11,8 +14,9 @@ class AlertService:
             return
         emoji = {"buy": "🟢", "sell": "🔴", "profit": "💰", "loss": "📉", "warning": "⚠️"}.get(alert_type, "📢")
         try:
-            async with aiohttp.ClientSession() as session:
-                await session.post(self.discord_webhook, json={"content": f"{emoji} {message}"}, timeout=aiohttp.ClientTimeout(total=5))
+            session = await http_client.get_session()
+            async with session.post(self.discord_webhook, data=orjson.dumps({"content": f"{emoji} {message}"}), headers=JSON_HEADERS, timeout=aiohttp.ClientTimeout(total=5)):
+                pass
         except:
             pass
     
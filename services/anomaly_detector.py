@@ -1,5 +1,13 @@
+import logging
+import pandas as pd
 from database import Database
 
+logger = logging.getLogger(__name__)
+
+MENTION_COLUMNS = ["coin", "count", "source", "market_cap", "age_hours"]
+MENTION_DEFAULTS = {"count": 0, "source": "unknown", "market_cap": 0, "age_hours": 999}
+MAX_SIGNALS = 20
+
 class AnomalyDetector:
     def __init__(self, db: Database):
         self.db = db
@@ -10,53 +18,42 @@ class AnomalyDetector:
         if not mentions:
             return []
         
-        coin_data = {}
-        for m in mentions:
-            coin = m.get("coin", "").upper()
-            if not coin:
-                continue
-            
-            count = m.get("count", 0)
-            source = m.get("source", "unknown")
-            market_cap = m.get("market_cap", 0)
-            age_hours = m.get("age_hours", 999)
-            
-            if coin not in coin_data:
-                coin_data[coin] = {
-                    "total_count": 0,
-                    "best_source": source,
-                    "best_count": count,
-                    "market_cap": market_cap,
-                    "age_hours": age_hours
-                }
-            
-            coin_data[coin]["total_count"] += count
-            
-            if count > coin_data[coin]["best_count"]:
-                coin_data[coin]["best_source"] = source
-                coin_data[coin]["best_count"] = count
-            
-            if market_cap > coin_data[coin]["market_cap"]:
-                coin_data[coin]["market_cap"] = market_cap
-            
-            if age_hours < coin_data[coin]["age_hours"]:
-                coin_data[coin]["age_hours"] = age_hours
+        df = pd.DataFrame(mentions, columns=MENTION_COLUMNS).fillna(MENTION_DEFAULTS)
+        df["coin"] = df["coin"].fillna("").astype(str).str.upper()
+        df = df[df["coin"] != ""]
+        if df.empty:
+            return []
+        
+        grouped = df.groupby("coin", sort=False)
+        agg = grouped.agg(
+            total_count=("count", "sum"),
+            market_cap=("market_cap", "max"),
+            age_hours=("age_hours", "min"),
+            num_sources=("source", "nunique")
+        )
+        # idxmax keeps the first row on ties, matching the "strictly greater" rule
+        best = df.loc[grouped["count"].idxmax(), ["coin", "source"]].set_index("coin")
+        # Only the strongest coins become signals, so drop the rest before any per-coin work
+        agg = agg.join(best).nlargest(MAX_SIGNALS, "total_count", keep="first")
         
-        signals = []
-        for coin, data in coin_data.items():
-            signal = {
-                "coin": coin,
-                "current_mentions": data["total_count"],
+        signals = [
+            {
+                "coin": row["coin"],
+                "current_mentions": row["total_count"],
                 "baseline_mentions": 0,
-                "percent_above_baseline": data["total_count"],
-                "source": data["best_source"],
-                "market_cap": data["market_cap"],
-                "age_hours": data["age_hours"]
+                "percent_above_baseline": row["total_count"],
+                "source": row["source"],
+                "market_cap": row["market_cap"],
+                "age_hours": row["age_hours"],
+                "num_sources": row["num_sources"]
             }
-            signals.append(signal)
-            await self.db.save_signal(signal)
+            for row in agg.reset_index().to_dict("records")
+        ]
+        await self.db.save_signals_bulk(signals)
         
-        signals.sort(key=lambda x: x["current_mentions"], reverse=True)
-        print(f"🎯 {len(signals)} signals")
+        logger.info("🎯 %d signals", len(signals))
+        if logger.isEnabledFor(logging.DEBUG):
+            for s in signals[:5]:
+                logger.debug("   %s: %d mentions via %s", s["coin"], s["current_mentions"], s["source"])
         
-        return signals[:20]
+        return signals
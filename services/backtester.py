@@ -1,6 +1,14 @@
 import aiohttp
+import asyncio
+import orjson
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict
+from services.cache import async_ttl_cache
+from services import http_client
+
+# The strategy reads live 5m/1h momentum; a minute keeps priceChange.m5 well inside
+# its own window while still absorbing repeated backtests of the same token
+PAIR_CACHE_SECONDS = 60
 
 class Backtester:
     """
@@ -10,6 +18,7 @@ class Backtester:
     
     def __init__(self):
         self.results = []
+        self.semaphore = asyncio.Semaphore(5)  # DexScreener rate limit
     
     async def backtest_token(self, contract_address: str, days: int = 7) -> dict:
         """Backtest our strategy on a single token"""
@@ -22,42 +31,46 @@ class Backtester:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get historical data
-                url = f"https://api.dexscreener.com/latest/dex/tokens/{contract_address}"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        pairs = data.get("pairs", [])
-                        
-                        if pairs:
-                            pair = pairs[0]
-                            
-                            # Simulate our strategy
-                            result["trades"] = self._simulate_strategy(pair)
-                            
-                            if result["trades"]:
-                                wins = [t for t in result["trades"] if t["pnl"] > 0]
-                                result["win_rate"] = len(wins) / len(result["trades"]) * 100
-                                result["total_pnl_percent"] = sum(t["pnl"] for t in result["trades"])
+            pair = await self._get_pair(contract_address)
+            if pair:
+                # Simulate our strategy
+                result["trades"] = self._simulate_strategy(pair)
+                
+                if result["trades"]:
+                    wins = [t for t in result["trades"] if t["pnl"] > 0]
+                    result["win_rate"] = len(wins) / len(result["trades"]) * 100
+                    result["total_pnl_percent"] = sum(t["pnl"] for t in result["trades"])
         except:
             pass
         
         return result
     
+    @async_ttl_cache(ttl_seconds=PAIR_CACHE_SECONDS)
+    async def _get_pair(self, contract_address: str) -> dict:
+        """Top DexScreener pair for a token; repeated backtests of the same token reuse it"""
+        session = await http_client.get_session()
+        url = f"https://api.dexscreener.com/latest/dex/tokens/{contract_address}"
+        async with self.semaphore:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                data = orjson.loads(await resp.read()) if resp.status == 200 else {}
+        
+        pairs = data.get("pairs") or []
+        return pairs[0] if pairs else {}
+    
     def _simulate_strategy(self, pair: dict) -> List[Dict]:
         """Simulate our entry/exit strategy"""
         trades = []
         
         # Get price changes as proxy for movement
-        change_5m = float(pair.get("priceChange", {}).get("m5") or 0)
-        change_1h = float(pair.get("priceChange", {}).get("h1") or 0)
-        change_24h = float(pair.get("priceChange", {}).get("h24") or 0)
+        price_change = pair.get("priceChange") or {}
+        change_5m = float(price_change.get("m5") or 0)
+        change_1h = float(price_change.get("h1") or 0)
+        liquidity_usd = float((pair.get("liquidity") or {}).get("usd") or 0)
         
         # Simulate: Would our entry have triggered?
         would_enter = (
             5 < change_1h < 30 and  # Momentum
-            float(pair.get("liquidity", {}).get("usd") or 0) >= 100000  # Liquidity
+            liquidity_usd >= 100000  # Liquidity
         )
         
         if would_enter:
@@ -76,12 +89,11 @@ class Backtester:
     
     async def run_backtest(self, tokens: List[str]) -> dict:
         """Run backtest on multiple tokens"""
-        all_results = []
-        
-        for token in tokens[:20]:  # Limit to avoid rate limits
-            result = await self.backtest_token(token)
-            if result["trades"]:
-                all_results.append(result)
+        results = await asyncio.gather(
+            *(self.backtest_token(token) for token in tokens[:20]),  # Limit to avoid rate limits
+            return_exceptions=True
+        )
+        all_results = [r for r in results if isinstance(r, dict) and r["trades"]]
         
         # Aggregate
         total_trades = sum(len(r["trades"]) for r in all_results)
@@ -0,0 +1,88 @@
+import asyncio
+import functools
+import time
+
+def async_ttl_cache(ttl_seconds: float, maxsize: int = 1024):
+    """
+    Memoize an async function's results for ttl_seconds, keyed by its arguments.
+    Falsy results (failed lookups) are not cached so they get retried next call.
+    """
+    def decorator(func):
+        cache = {}
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            
+            hit = cache.get(key)
+            if hit and hit[0] > now:
+                return hit[1]
+            
+            value = await func(*args, **kwargs)
+            if value:
+                if len(cache) >= maxsize:
+                    for k in [k for k, (expires, _) in cache.items() if expires <= now]:
+                        del cache[k]
+                    if len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+                cache[key] = (now + ttl_seconds, value)
+            return value
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+class AsyncTTLCache:
+    """
+    Per-key TTL cache for coroutine results with single-flight: concurrent
+    callers asking for the same missing key share one in-flight fetch.
+    The fetch runs in its own task, so cancelling one caller doesn't cancel
+    (or fail) it for the others.
+    Bounded like async_ttl_cache: expired entries are purged first, then the oldest.
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.entries = {}  # key -> (expires_at, value)
+        self.inflight = {}  # key -> asyncio.Task
+    
+    async def get_or_fetch(self, key, ttl_seconds: float, fetch, cache_if=bool):
+        hit = self.entries.get(key)
+        if hit and hit[0] > time.monotonic():
+            return hit[1]
+        
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, ttl_seconds, fetch, cache_if))
+            # Retrieve the outcome even if every caller was cancelled meanwhile
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self.inflight[key] = task
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, key, ttl_seconds: float, fetch, cache_if):
+        task = asyncio.current_task()
+        try:
+            value = await fetch()
+            # An invalidate() while this was in flight means the value may be stale
+            if cache_if(value) and self.inflight.get(key) is task:
+                self._store(key, value, ttl_seconds)
+            return value
+        finally:
+            if self.inflight.get(key) is task:
+                del self.inflight[key]
+    
+    def _store(self, key, value, ttl_seconds: float):
+        now = time.monotonic()
+        self.entries.pop(key, None)
+        if len(self.entries) >= self.maxsize:
+            for k in [k for k, (expires, _) in self.entries.items() if expires <= now]:
+                del self.entries[k]
+            if len(self.entries) >= self.maxsize:
+                del self.entries[next(iter(self.entries))]
+        self.entries[key] = (now + ttl_seconds, value)
+    
+    def invalidate(self, key):
+        """Drop the cached value; a fetch already in flight won't be stored, and later callers start afresh"""
+        self.entries.pop(key, None)
+        self.inflight.pop(key, None)
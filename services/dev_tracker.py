@@ -1,12 +1,17 @@
 import aiohttp
+import asyncio
+import orjson
 import os
 from datetime import datetime, timezone
+from services import http_client
+from services.http_client import JSON_HEADERS
 
 class DevWalletTracker:
     def __init__(self):
         self.dev_wallets = {}  # contract -> deployer wallet
         self.dev_selling = set()  # contracts where dev is selling
         self.dev_holdings = {}  # contract -> dev still holds tokens
+        self.detail_semaphore = asyncio.Semaphore(8)  # Solscan rate limit
     
     async def get_deployer_wallet(self, contract_address: str) -> str:
         """Get the wallet that created/deployed the token"""
@@ -14,29 +19,29 @@ class DevWalletTracker:
             return self.dev_wallets[contract_address]
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Try Solscan token meta
-                url = f"https://public-api.solscan.io/token/meta?tokenAddress={contract_address}"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            session = await http_client.get_session()
+            # Try Solscan token meta
+            url = f"https://public-api.solscan.io/token/meta?tokenAddress={contract_address}"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    data = orjson.loads(await resp.read())
+                    creator = data.get("creator", "")
+                    if creator:
+                        self.dev_wallets[contract_address] = creator
+                        return creator
+            
+            # Fallback: try Helius
+            helius_key = os.getenv("HELIUS_API_KEY", "")
+            if helius_key:
+                url = f"https://api.helius.xyz/v0/token-metadata?api-key={helius_key}"
+                async with session.post(url, data=orjson.dumps({"mintAccounts": [contract_address]}), headers=JSON_HEADERS, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
-                        creator = data.get("creator", "")
-                        if creator:
-                            self.dev_wallets[contract_address] = creator
-                            return creator
-                
-                # Fallback: try Helius
-                helius_key = os.getenv("HELIUS_API_KEY", "")
-                if helius_key:
-                    url = f"https://api.helius.xyz/v0/token-metadata?api-key={helius_key}"
-                    async with session.post(url, json={"mintAccounts": [contract_address]}, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            if data and len(data) > 0:
-                                authority = data[0].get("onChainAccountInfo", {}).get("accountInfo", {}).get("data", {}).get("parsed", {}).get("info", {}).get("mintAuthority", "")
-                                if authority:
-                                    self.dev_wallets[contract_address] = authority
-                                    return authority
+                        data = orjson.loads(await resp.read())
+                        if data and len(data) > 0:
+                            authority = data[0].get("onChainAccountInfo", {}).get("accountInfo", {}).get("data", {}).get("parsed", {}).get("info", {}).get("mintAuthority", "")
+                            if authority:
+                                self.dev_wallets[contract_address] = authority
+                                return authority
         except:
             pass
         
@@ -47,19 +52,19 @@ class DevWalletTracker:
         result = {"holds_tokens": False, "balance_percent": 0}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://public-api.solscan.io/account/tokens?account={dev_wallet}"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for token in data:
-                            if token.get("tokenAddress") == contract_address:
-                                result["holds_tokens"] = True
-                                # Get percentage of supply
-                                amount = float(token.get("tokenAmount", {}).get("uiAmount", 0))
-                                # We'd need total supply to calc percent, estimate for now
-                                result["balance_percent"] = min(amount * 100, 100)
-                                break
+            session = await http_client.get_session()
+            url = f"https://public-api.solscan.io/account/tokens?account={dev_wallet}"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    data = orjson.loads(await resp.read())
+                    for token in data:
+                        if token.get("tokenAddress") == contract_address:
+                            result["holds_tokens"] = True
+                            # Get percentage of supply
+                            amount = float(token.get("tokenAmount", {}).get("uiAmount", 0))
+                            # We'd need total supply to calc percent, estimate for now
+                            result["balance_percent"] = min(amount * 100, 100)
+                            break
         except:
             pass
         
@@ -85,44 +90,59 @@ class DevWalletTracker:
         result["dev_wallet"] = dev_wallet
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get dev's recent transactions
-                url = f"https://public-api.solscan.io/account/transactions?account={dev_wallet}&limit=30"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        
-                        sell_count = 0
-                        for tx in (data if isinstance(data, list) else []):
-                            # Look for sells of this specific token
-                            tx_hash = tx.get("txHash", "")
-                            
-                            # Check transaction details for token transfers
-                            detail_url = f"https://public-api.solscan.io/transaction/{tx_hash}"
-                            try:
-                                async with session.get(detail_url, timeout=aiohttp.ClientTimeout(total=5)) as detail_resp:
-                                    if detail_resp.status == 200:
-                                        detail = await detail_resp.json()
-                                        
-                                        # Look for token transfer FROM dev wallet
-                                        for transfer in detail.get("tokenTransfers", []):
-                                            if (transfer.get("source") == dev_wallet and 
-                                                transfer.get("token") == contract_address):
-                                                sell_count += 1
-                            except:
-                                continue
-                        
-                        result["recent_sells"] = sell_count
-                        
-                        if sell_count >= 2:
-                            result["is_selling"] = True
-                            result["warning"] = f"Dev sold {sell_count}x recently!"
-                            self.dev_selling.add(contract_address)
+            session = await http_client.get_session()
+            # Get dev's recent transactions
+            url = f"https://public-api.solscan.io/account/transactions?account={dev_wallet}&limit=30"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    return result
+                data = orjson.loads(await resp.read())
+            
+            # Check transaction details for token transfers, several at a time,
+            # and stop as soon as we've seen enough sells to flag the dev
+            txs = data if isinstance(data, list) else []
+            tasks = [
+                asyncio.create_task(self._fetch_tx_detail(session, tx.get("txHash", "")))
+                for tx in txs
+            ]
+            sell_count = 0
+            try:
+                for next_detail in asyncio.as_completed(tasks):
+                    try:
+                        detail = await next_detail
+                    except Exception:
+                        continue
+                    
+                    # Look for token transfers FROM dev wallet of this specific token
+                    for transfer in detail.get("tokenTransfers", []):
+                        if (transfer.get("source") == dev_wallet and
+                            transfer.get("token") == contract_address):
+                            sell_count += 1
+                    if sell_count >= 2:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+            
+            result["recent_sells"] = sell_count
+            
+            if sell_count >= 2:
+                result["is_selling"] = True
+                result["warning"] = f"Dev sold {sell_count}x recently!"
+                self.dev_selling.add(contract_address)
         except:
             pass
         
         return result
     
+    async def _fetch_tx_detail(self, session: aiohttp.ClientSession, tx_hash: str) -> dict:
+        async with self.detail_semaphore:
+            url = f"https://public-api.solscan.io/transaction/{tx_hash}"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                if resp.status == 200:
+                    return orjson.loads(await resp.read())
+        return {}
+    
     def is_known_dev_seller(self, contract_address: str) -> bool:
         """Quick check without API calls"""
         return contract_address in self.dev_selling
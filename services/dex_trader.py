@@ -1,9 +1,186 @@
 import os
-import json
+import logging
+import random
+import time
 import asyncio
 import aiohttp
+import orjson
 import uuid
+from collections import defaultdict, deque
 from datetime import datetime, timezone
+from decimal import Decimal, ROUND_DOWN
+from services.cache import AsyncTTLCache
+from services.http_client import JSON_HEADERS
+
+try:
+    from cdp import CdpClient
+    from cdp.solana_client import SolanaClient
+except ImportError:
+    CdpClient = SolanaClient = None
+
+logger = logging.getLogger(__name__)
+
+USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+BALANCE_CACHE_SECONDS = float(os.getenv("BALANCE_TTL", "5"))  # dropped after every trade regardless
+QUOTE_CACHE_SECONDS = 2  # Jupiter routes go stale fast
+BUY_SLIPPAGE_BPS = 300
+SELL_SLIPPAGE_BPS = 500
+
+def usdc_to_raw(amount_usdc: float) -> int:
+    """
+    USDC amount in micro-USDC, rounded down. int(amount * 1e6) truncates binary
+    float error the wrong way (2.01 * 1e6 -> 2009999); going through the decimal
+    repr doesn't.
+    """
+    return int(Decimal(str(amount_usdc)).scaleb(6).to_integral_value(rounding=ROUND_DOWN))
+
+# Built once; every request on the shared session reuses these
+BALANCE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+QUOTE_TIMEOUT = aiohttp.ClientTimeout(total=15)
+SWAP_TIMEOUT = aiohttp.ClientTimeout(total=20)
+PREWARM_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Extra quote endpoints (comma separated) are raced against the public one;
+# swap builds are raced across the matching /swap endpoints
+JUPITER_QUOTE_URLS = ["https://public.jupiterapi.com/quote"] + [
+    url.strip() for url in os.getenv("JUPITER_QUOTE_URLS", "").split(",") if url.strip()
+]
+JUPITER_SWAP_URLS = [url.rsplit("/quote", 1)[0] + "/swap" for url in JUPITER_QUOTE_URLS]
+
+# Keyed Jupiter (api.jup.ag) is only worth adding above with a key; the key is
+# sent to that host alone, never to the public/third-party mirrors
+JUPITER_API_KEY = os.getenv("JUPITER_API_KEY", "")
+HELIUS_API_URL = os.getenv("HELIUS_API_URL", "https://api.helius.xyz").rstrip("/")
+
+def _jupiter_headers(url: str, base: dict = None) -> dict:
+    headers = dict(base or {})
+    if JUPITER_API_KEY and url.startswith("https://api.jup.ag/"):
+        headers["x-api-key"] = JUPITER_API_KEY
+    return headers
+
+# Full-jitter exponential backoff between swap attempts, plus a cap on how many
+# retries all swaps together may spend per window so they can't stampede an API
+RETRY_BASE_SECONDS = 0.2
+RETRY_CAP_SECONDS = 2.0
+RETRY_BUDGET = 10
+RETRY_BUDGET_WINDOW = 60
+
+# End-to-end wall-clock budget for one swap, across all of its attempts.
+# Sells get longer: failing to exit a position is worse than missing an entry.
+BUY_DEADLINE_SECONDS = 20
+SELL_DEADLINE_SECONDS = 30
+NON_RETRYABLE_ERRORS = ("insufficient", "quote failed: 400")
+RETRY_AFTER_CAP_SECONDS = 30
+
+class ProviderError(Exception):
+    """A provider refused or failed a request (open circuit, non-200 status)"""
+
+# Failures a provider round trip is expected to produce (network, timeout,
+# open circuit / bad status, undecodable body). Anything else is a bug and
+# gets logged with its traceback.
+TRANSIENT_ERRORS = (ProviderError, aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError)
+
+def _is_retryable(error: str) -> bool:
+    lowered = error.lower()
+    return "blockhash" in lowered or not any(marker in lowered for marker in NON_RETRYABLE_ERRORS)
+
+async def _backoff(attempt: int, deadline: float, not_before: float = 0):
+    """Jittered sleep that also waits until not_before (a Retry-After hold), but never past the deadline"""
+    now = time.monotonic()
+    delay = random.uniform(0, min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt))
+    delay = max(delay, not_before - now)
+    await asyncio.sleep(max(0, min(delay, deadline - now)))
+
+def _retry_after_seconds(resp) -> float:
+    """Retry-After (delta-seconds form) on a 429/503, capped; 0 when absent or unparseable"""
+    if resp.status not in (429, 503):
+        return 0
+    try:
+        return min(float(resp.headers.get("Retry-After", 0)), RETRY_AFTER_CAP_SECONDS)
+    except ValueError:
+        return 0
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures so callers fail fast;
+    once reset_timeout has passed, calls are let through again (half-open)
+    and the first success closes it.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.held_until = 0  # provider asked us to back off (Retry-After)
+    
+    def allow(self) -> bool:
+        now = time.monotonic()
+        if now < self.held_until:
+            return False
+        return self.opened_at is None or now - self.opened_at >= self.reset_timeout
+    
+    def hold(self, seconds: float):
+        self.held_until = max(self.held_until, time.monotonic() + seconds)
+    
+    def record(self, ok: bool):
+        if ok:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+class RateLimiter:
+    """Token bucket: up to max_rate acquisitions per time_period; callers wait when it's empty"""
+    
+    def __init__(self, max_rate: int, time_period: float):
+        self.capacity = max_rate
+        self.rate = max_rate / time_period
+        self.tokens = float(max_rate)
+        self.updated = time.monotonic()
+    
+    async def __aenter__(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return self
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aexit__(self, *exc):
+        return False
+
+async def _race(coros, is_ok):
+    """
+    Run coros concurrently and return the first result passing is_ok, cancelling
+    the rest. Falls back to the first failed result, or re-raises if all raised.
+    """
+    if len(coros) == 1:
+        return await coros[0]
+    
+    tasks = [asyncio.create_task(c) for c in coros]
+    failed, last_error = None, None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                outcome = await next_done
+            except Exception as e:
+                last_error = e
+                continue
+            if is_ok(outcome):
+                return outcome
+            failed = failed or outcome
+    finally:
+        for task in tasks:
+            task.cancel()
+    
+    if failed:
+        return failed
+    raise last_error
 
 class DexTrader:
     def __init__(self):
@@ -11,258 +188,416 @@ class DexTrader:
         self.client = None
         self.solana_client = None
         self.solana_address = "BQVcTBUUHRcniikRzyfmddzkkUtDABkASvaVua13Yq4n"
+        # Everything in the /swap body except the quote is fixed for this wallet
+        self.swap_body_prefix = b'{"userPublicKey":' + orjson.dumps(self.solana_address) + b',"quoteResponse":'
         self.chain = "solana"
         self.last_trade_time = None
         self.min_trade_interval = 5
         self.pending_trades = set()
+        self.session = None
+        self.cache = AsyncTTLCache()
+        self.retry_times = deque()  # monotonic timestamps of recent swap retries
+        self.breakers = defaultdict(CircuitBreaker)  # endpoint -> breaker
+        # Shared by every trade so concurrent positions stay inside provider quotas
+        self.helius_limiter = RateLimiter(40, 10)
+        self.jupiter_limiter = RateLimiter(50, 10)
+        self.init_lock = asyncio.Lock()
+        self.prewarm_task = None
+        self.tx_hash_attr = None  # field holding the signature on CDP send results
+    
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=QUOTE_TIMEOUT
+            )
+        return self.session
+    
+    async def close(self):
+        if self.session and not self.session.closed:
+            await self.session.close()
+        if self.client and hasattr(self.client, "close"):
+            try:
+                await self.client.close()
+            except Exception as e:
+                logger.warning("CDP close error: %s", e)
+    
+    async def ensure_initialized(self) -> bool:
+        """Cheap check for callers; only the first caller builds the CDP client"""
+        if self.initialized:
+            return True
+        return await self.initialize()
     
     async def initialize(self):
+        async with self.init_lock:
+            if self.initialized:
+                return True
+            return await self._initialize()
+    
+    async def _initialize(self):
         try:
             api_key = os.getenv("CDP_API_KEY_NAME")
             api_secret = os.getenv("CDP_API_KEY_SECRET", "").replace("\\n", "\n")
             
             if not api_key or not api_secret:
-                print("❌ Missing CDP API credentials")
+                logger.error("❌ Missing CDP API credentials")
                 return False
             
-            from cdp import CdpClient
-            from cdp.solana_client import SolanaClient
+            if CdpClient is None:
+                logger.error("❌ cdp-sdk not installed")
+                return False
             
             self.client = CdpClient(api_key_id=api_key, api_key_secret=api_secret)
             self.solana_client = SolanaClient(self.client.api_clients)
             
             self.initialized = True
-            print(f"✅ Solana ready: {self.solana_address}")
+            logger.info("✅ Solana ready: %s", self.solana_address)
+            # Don't hold up startup, but have pooled connections ready for the first trade
+            self.prewarm_task = asyncio.create_task(self._prewarm())
             return True
             
         except Exception as e:
-            print(f"❌ CDP init failed: {e}")
+            logger.exception("❌ CDP init failed: %s", e)
             return False
     
+    async def _prewarm(self):
+        """Resolve DNS and open TLS connections to the hot hosts so the first trade starts warm"""
+        session = await self.get_session()
+        hosts = {url.split("/", 3)[2] for url in JUPITER_QUOTE_URLS + JUPITER_SWAP_URLS}
+        urls = [f"https://{host}/" for host in hosts] + [f"{HELIUS_API_URL}/"]
+        
+        async def touch(url):
+            async with session.head(url, timeout=PREWARM_TIMEOUT) as resp:
+                return resp.status
+        
+        await asyncio.gather(*(touch(url) for url in urls), return_exceptions=True)
+    
     async def get_balances(self) -> dict:
-        balances = {"sol": 0, "usdc": 0}
         try:
-            helius_key = os.getenv('HELIUS_API_KEY', '')
-            async with aiohttp.ClientSession() as session:
-                url = f"https://api.helius.xyz/v0/addresses/{self.solana_address}/balances?api-key={helius_key}"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        balances["sol"] = data.get("nativeBalance", 0) / 1e9
-                        for token in data.get("tokens", []):
-                            if token.get("mint") == "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v":
-                                balances["usdc"] = float(token.get("amount", 0)) / 1e6
-                                break
+            wallet = await self._get_wallet()
+            return {"sol": wallet["sol"], "usdc": wallet["usdc"]}
+        except TRANSIENT_ERRORS as e:
+            logger.warning("Balance error: %r", e)
         except Exception as e:
-            print(f"Balance error: {e}")
-        return balances
+            logger.exception("❌ Balance error: %s", e)
+        return {"sol": 0, "usdc": 0}
     
-    async def swap_usdc_to_token(self, token_address: str, amount_usdc: float, max_retries: int = 3) -> dict:
-        result = {"success": False, "tx_hash": "", "error": ""}
+    async def get_token_balance(self, mint: str) -> int:
+        """Raw token amount held, read from the same wallet snapshot as get_balances"""
+        wallet = await self._get_wallet()
+        return wallet["tokens"].get(mint, 0)
+    
+    async def _get_wallet(self) -> dict:
+        return await self.cache.get_or_fetch(
+            ("balances", self.solana_address), BALANCE_CACHE_SECONDS, self._fetch_wallet
+        )
+    
+    async def _fetch_wallet(self) -> dict:
+        """SOL, USDC and every SPL token balance in one Helius round trip"""
+        helius_key = os.getenv('HELIUS_API_KEY', '')
+        session = await self.get_session()
+        url = f"{HELIUS_API_URL}/v0/addresses/{self.solana_address}/balances?api-key={helius_key}"
+        
+        async def fetch():
+            async with self.helius_limiter:
+                async with session.get(url, timeout=BALANCE_TIMEOUT) as resp:
+                    self._note_retry_after("helius", resp)
+                    return resp.status, await resp.read()
+        
+        if not self.breakers["helius"].allow():
+            raise ProviderError("Helius circuit open")
+        status, body = await self._guarded("helius", fetch())
+        if status != 200:
+            raise ProviderError(f"Helius balances: {status}")
+        data = orjson.loads(body)
+        tokens = {
+            token["mint"]: int(token.get("amount") or 0)
+            for token in data.get("tokens", [])
+            if token.get("mint")
+        }
+        return {
+            "sol": data.get("nativeBalance", 0) / 1e9,
+            "usdc": tokens.get(USDC_MINT, 0) / 1e6,
+            "tokens": tokens
+        }
+    
+    async def get_quote(self, input_mint: str, output_mint: str, amount_raw: int, slippage_bps: int) -> tuple:
+        """
+        Jupiter quote as (status, quote, quote_json); successful quotes are reused
+        for a couple of seconds. quote_json is the encoded quote ready to embed in
+        the swap request - Jupiter's own bytes unless platformFee had to be stripped.
+        """
+        async def fetch_one(session, base_url):
+            quote_url = f"{base_url}?inputMint={input_mint}&outputMint={output_mint}&amount={amount_raw}&slippageBps={slippage_bps}"
+            async with self.jupiter_limiter:
+                async with session.get(quote_url, headers=_jupiter_headers(base_url), timeout=QUOTE_TIMEOUT) as resp:
+                    self._note_retry_after(base_url, resp)
+                    if resp.status != 200:
+                        return resp.status, None, b""
+                    raw = await resp.read()
+            quote = orjson.loads(raw)
+            if "platformFee" in quote:
+                del quote["platformFee"]
+                raw = orjson.dumps(quote)
+            return 200, quote, raw
+        
+        async def fetch():
+            urls = self._available(JUPITER_QUOTE_URLS)
+            if not urls:
+                return 503, None, b""
+            session = await self.get_session()
+            return await _race(
+                [self._guarded(url, fetch_one(session, url)) for url in urls],
+                lambda r: r[1] and r[1].get("outAmount")
+            )
         
+        key = ("quote", input_mint, output_mint, amount_raw, slippage_bps)
+        return await self.cache.get_or_fetch(
+            key, QUOTE_CACHE_SECONDS, fetch, cache_if=lambda r: r[1] and r[1].get("outAmount")
+        )
+    
+    def _note_retry_after(self, endpoint: str, resp):
+        """Keep away from an endpoint for as long as its Retry-After asks"""
+        seconds = _retry_after_seconds(resp)
+        if seconds > 0:
+            self.breakers[endpoint].hold(seconds)
+    
+    def _swap_not_before(self) -> float:
+        """
+        Earliest time a swap attempt can get both a quote and a build: each is
+        raced across its mirrors, so one un-held mirror per stage is enough.
+        Holds on other providers (e.g. a Helius 429 from balance polling) don't count.
+        """
+        return max(
+            min(self.breakers[url].held_until for url in JUPITER_QUOTE_URLS),
+            min(self.breakers[url].held_until for url in JUPITER_SWAP_URLS)
+        )
+    
+    def _available(self, urls: list) -> list:
+        """Endpoints whose circuit isn't open"""
+        return [url for url in urls if self.breakers[url].allow()]
+    
+    async def _guarded(self, endpoint: str, call) -> tuple:
+        """Await a call returning (status, ...), feeding the outcome to the endpoint's breaker"""
+        breaker = self.breakers[endpoint]
+        try:
+            outcome = await call
+        except Exception:
+            breaker.record(False)
+            raise
+        status = outcome[0]
+        breaker.record(status < 500 and status != 429)
+        return outcome
+    
+    def _forget_quote(self, input_mint: str, output_mint: str, amount_raw: int, slippage_bps: int):
+        self.cache.invalidate(("quote", input_mint, output_mint, amount_raw, slippage_bps))
+    
+    def _after_trade(self):
+        self.last_trade_time = datetime.now(timezone.utc)
+        self.cache.invalidate(("balances", self.solana_address))
+    
+    async def swap_usdc_to_token(self, token_address: str, amount_usdc: float, max_retries: int = 3,
+                                 deadline_seconds: float = BUY_DEADLINE_SECONDS) -> dict:
         if not self.initialized:
-            result["error"] = "DEX not initialized"
-            return result
+            return {"success": False, "tx_hash": "", "error": "DEX not initialized"}
         
         trade_key = f"buy_{token_address}"
         if trade_key in self.pending_trades:
-            result["error"] = "Trade already pending"
-            return result
+            return {"success": False, "tx_hash": "", "error": "Trade already pending"}
         
         self.pending_trades.add(trade_key)
-        
+        deadline = time.monotonic() + deadline_seconds
         try:
-            for attempt in range(max_retries):
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        amount_raw = int(amount_usdc * 1e6)
-                        quote_url = f"https://public.jupiterapi.com/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint={token_address}&amount={amount_raw}&slippageBps=300"
-                        
-                        async with session.get(quote_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                            if resp.status != 200:
-                                result["error"] = f"Quote failed: {resp.status}"
-                                continue
-                            quote = await resp.json()
-                        
-                        if not quote.get("outAmount"):
-                            result["error"] = "No route found"
-                            continue
-                        
-                        if "platformFee" in quote:
-                            del quote["platformFee"]
-                        
-                        print(f"🔍 Quote: {amount_usdc} USDC -> {int(quote.get('outAmount', 0))} tokens")
-                        
-                        swap_url = "https://public.jupiterapi.com/swap"
-                        swap_body = {
-                            "userPublicKey": self.solana_address,
-                            "quoteResponse": quote
-                        }
-                        
-                        async with session.post(swap_url, json=swap_body, timeout=aiohttp.ClientTimeout(total=20)) as resp:
-                            resp_text = await resp.text()
-                            if resp.status != 200:
-                                print(f"🔍 Swap error: {resp_text[:200]}")
-                                result["error"] = f"Swap: {resp_text[:80]}"
-                                continue
-                            swap_data = json.loads(resp_text)
-                        
-                        tx_base64 = swap_data.get("swapTransaction")
-                        if not tx_base64:
-                            result["error"] = "No transaction"
-                            continue
-                        
-                        print(f"🔍 Sending via CDP (network=solana-mainnet)...")
-                        
-                        try:
-                            # Correct signature: send_transaction(network, transaction, idempotency_key)
-                            idempotency_key = str(uuid.uuid4())
-                            tx_result = self.solana_client.send_transaction(
-                                "solana",
-                                tx_base64,
-                                idempotency_key
-                            )
-                            
-                            if asyncio.iscoroutine(tx_result):
-                                tx_result = await tx_result
-                            
-                            print(f"🔍 TX result type: {type(tx_result)}")
-                            print(f"🔍 TX result: {tx_result}")
-                            
-                            result["success"] = True
-                            if hasattr(tx_result, 'signature'):
-                                result["tx_hash"] = tx_result.signature
-                            elif hasattr(tx_result, 'transaction_hash'):
-                                result["tx_hash"] = tx_result.transaction_hash
-                            elif isinstance(tx_result, dict):
-                                result["tx_hash"] = tx_result.get("signature", tx_result.get("hash", str(tx_result)))
-                            else:
-                                result["tx_hash"] = str(tx_result)
-                            
-                            self.last_trade_time = datetime.now(timezone.utc)
-                            print(f"✅ TX sent: {result['tx_hash']}")
-                            return result
-                            
-                        except Exception as e:
-                            error_str = str(e)
-                            print(f"❌ CDP error: {error_str}")
-                            result["error"] = error_str[:100]
-                            if "blockhash" in error_str.lower():
-                                await asyncio.sleep(1)
-                                continue
-                        
-                except asyncio.TimeoutError:
-                    result["error"] = f"Timeout {attempt + 1}"
-                    await asyncio.sleep(2)
-                except Exception as e:
-                    print(f"❌ Error: {e}")
-                    result["error"] = str(e)[:100]
-                    await asyncio.sleep(2)
-                    
+            amount_raw = usdc_to_raw(amount_usdc)
+            quote_args = (USDC_MINT, token_address, amount_raw, BUY_SLIPPAGE_BPS)
+            logger.debug("🔍 Buying %s for %s USDC", token_address[:8], amount_usdc)
+            
+            # Check funds while the quote is in flight; the quote lands in the
+            # cache, so the first swap attempt picks it up without another trip
+            wallet, _ = await asyncio.gather(
+                self._get_wallet(), self.get_quote(*quote_args), return_exceptions=True
+            )
+            if isinstance(wallet, dict) and wallet["usdc"] < amount_usdc:
+                return {"success": False, "tx_hash": "", "error": f"Insufficient USDC: {wallet['usdc']:.2f}"}
+            
+            return await self._execute_swap(quote_args, max_retries, deadline)
         finally:
             self.pending_trades.discard(trade_key)
-        
-        return result
     
-    async def swap_token_to_usdc(self, token_address: str, max_retries: int = 3) -> dict:
-        result = {"success": False, "tx_hash": "", "error": ""}
-        
+    async def swap_token_to_usdc(self, token_address: str, max_retries: int = 3,
+                                 deadline_seconds: float = SELL_DEADLINE_SECONDS) -> dict:
         if not self.initialized:
-            result["error"] = "DEX not initialized"
-            return result
+            return {"success": False, "tx_hash": "", "error": "DEX not initialized"}
         
         trade_key = f"sell_{token_address}"
         if trade_key in self.pending_trades:
-            result["error"] = "Sell already pending"
-            return result
+            return {"success": False, "tx_hash": "", "error": "Sell already pending"}
         
         self.pending_trades.add(trade_key)
-        
+        deadline = time.monotonic() + deadline_seconds
         try:
-            token_balance = 0
-            async with aiohttp.ClientSession() as session:
-                helius_key = os.getenv('HELIUS_API_KEY', '')
-                url = f"https://api.helius.xyz/v0/addresses/{self.solana_address}/balances?api-key={helius_key}"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        for token in data.get("tokens", []):
-                            if token.get("mint") == token_address:
-                                token_balance = int(token.get("amount", 0))
-                                break
+            try:
+                token_balance = await self.get_token_balance(token_address)
+            except TRANSIENT_ERRORS as e:
+                logger.warning("Token balance error: %r", e)
+                token_balance = 0
+            except Exception as e:
+                logger.exception("❌ Token balance error: %s", e)
+                token_balance = 0
             
             if token_balance == 0:
-                result["error"] = "No token balance"
-                return result
+                return {"success": False, "tx_hash": "", "error": "No token balance"}
             
-            for attempt in range(max_retries):
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        quote_url = f"https://public.jupiterapi.com/quote?inputMint={token_address}&outputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&amount={token_balance}&slippageBps=500"
-                        
-                        async with session.get(quote_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                            if resp.status != 200:
-                                result["error"] = f"Quote failed: {resp.status}"
-                                continue
-                            quote = await resp.json()
-                        
-                        if not quote.get("outAmount"):
-                            result["error"] = "No sell route"
-                            return result
-                        
-                        if "platformFee" in quote:
-                            del quote["platformFee"]
-                        
-                        swap_url = "https://public.jupiterapi.com/swap"
-                        swap_body = {
-                            "userPublicKey": self.solana_address,
-                            "quoteResponse": quote
-                        }
-                        
-                        async with session.post(swap_url, json=swap_body, timeout=aiohttp.ClientTimeout(total=20)) as resp:
-                            if resp.status != 200:
-                                result["error"] = f"Swap: {resp.status}"
-                                continue
-                            swap_data = await resp.json()
-                        
-                        tx_base64 = swap_data.get("swapTransaction")
-                        if not tx_base64:
-                            result["error"] = "No transaction"
-                            continue
-                        
-                        try:
-                            idempotency_key = str(uuid.uuid4())
-                            tx_result = self.solana_client.send_transaction(
-                                "solana",
-                                tx_base64,
-                                idempotency_key
-                            )
-                            
-                            if asyncio.iscoroutine(tx_result):
-                                tx_result = await tx_result
-                            
-                            result["success"] = True
-                            if hasattr(tx_result, 'signature'):
-                                result["tx_hash"] = tx_result.signature
-                            else:
-                                result["tx_hash"] = str(tx_result)
-                            
-                            self.last_trade_time = datetime.now(timezone.utc)
-                            return result
-                            
-                        except Exception as e:
-                            result["error"] = str(e)[:100]
-                        
-                except asyncio.TimeoutError:
-                    result["error"] = f"Timeout {attempt + 1}"
-                    await asyncio.sleep(2)
-                except Exception as e:
-                    result["error"] = str(e)[:100]
-                    await asyncio.sleep(2)
-                    
+            return await self._execute_swap(
+                (token_address, USDC_MINT, token_balance, SELL_SLIPPAGE_BPS), max_retries, deadline, no_route_error="No sell route"
+            )
         finally:
             self.pending_trades.discard(trade_key)
+    
+    async def _execute_swap(self, quote_args: tuple, max_retries: int, deadline: float,
+                            no_route_error: str = "") -> dict:
+        """
+        Quote -> build -> send with retries. Nothing is built ahead of need: a
+        failed send is re-quoted and rebuilt only after its backoff, so a
+        blockhash retry gets a new blockhash rather than one fetched alongside
+        the transaction that just failed.
+        
+        deadline: time.monotonic() value after which no new attempt starts and
+        quote/build calls are cut off. A CDP send already in flight is never
+        cancelled - the transaction may still land.
+        
+        no_route_error: when set, a missing route ends the swap with that error
+        instead of retrying.
+        """
+        result = {"success": False, "tx_hash": "", "error": ""}
+        
+        for attempt in range(max_retries):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                result["error"] = result["error"] or "Deadline exceeded"
+                break
+            if attempt and not self._take_retry():
+                logger.warning("⚠️ Retry budget exhausted, giving up: %s", result["error"])
+                break
+            
+            try:
+                tx_base64, error = await asyncio.wait_for(self._prepare_swap(quote_args), remaining)
+                
+                if not tx_base64:
+                    result["error"] = error
+                    if error == "No route found" and no_route_error:
+                        result["error"] = no_route_error
+                        return result
+                    if not _is_retryable(error):
+                        return result
+                    await _backoff(attempt, deadline, self._swap_not_before())
+                    continue
+                
+                try:
+                    result["tx_hash"] = await self._send_swap(tx_base64)
+                    result["success"] = True
+                    result["error"] = ""
+                    self._after_trade()
+                    logger.info("✅ TX sent: %s", result["tx_hash"])
+                    return result
+                    
+                except Exception as e:
+                    error_str = str(e)
+                    logger.error("❌ CDP error: %s", error_str)
+                    result["error"] = error_str[:100]
+                    self._forget_quote(*quote_args)
+                    if not _is_retryable(error_str):
+                        return result
+                    await _backoff(attempt, deadline, self._swap_not_before())
+                
+            except asyncio.TimeoutError:
+                result["error"] = f"Timeout {attempt + 1}"
+                await _backoff(attempt, deadline, self._swap_not_before())
+            except TRANSIENT_ERRORS as e:
+                logger.warning("⚠️ Swap attempt %d failed: %r", attempt + 1, e)
+                result["error"] = str(e)[:100] or type(e).__name__
+                await _backoff(attempt, deadline, self._swap_not_before())
+            except Exception as e:
+                logger.exception("❌ Swap error: %s", e)
+                result["error"] = str(e)[:100]
+                await _backoff(attempt, deadline, self._swap_not_before())
         
         return result
+    
+    def _take_retry(self) -> bool:
+        """Spend one retry from the budget shared by all swaps"""
+        now = time.monotonic()
+        while self.retry_times and now - self.retry_times[0] > RETRY_BUDGET_WINDOW:
+            self.retry_times.popleft()
+        if len(self.retry_times) >= RETRY_BUDGET:
+            return False
+        self.retry_times.append(now)
+        return True
+    
+    async def _prepare_swap(self, quote_args: tuple) -> tuple:
+        """Fetch a quote and have Jupiter build the swap; returns (tx_base64, error)"""
+        status, quote, quote_json = await self.get_quote(*quote_args)
+        if status != 200:
+            return None, f"Quote failed: {status}"
+        
+        if not quote.get("outAmount"):
+            return None, "No route found"
+        
+        logger.debug("🔍 Quote: %s -> %s", quote_args[2], quote.get("outAmount"))
+        
+        session = await self.get_session()
+        # Splice the quote bytes in rather than re-encoding the (large) routePlan
+        swap_body = self.swap_body_prefix + quote_json + b'}'
+        
+        async def build(swap_url):
+            async with self.jupiter_limiter:
+                async with session.post(
+                    swap_url, data=swap_body, headers=_jupiter_headers(swap_url, JSON_HEADERS), timeout=SWAP_TIMEOUT
+                ) as resp:
+                    self._note_retry_after(swap_url, resp)
+                    return resp.status, await resp.read()
+        
+        urls = self._available(JUPITER_SWAP_URLS)
+        if not urls:
+            return None, "Swap: circuit open"
+        status, body = await _race([self._guarded(url, build(url)) for url in urls], lambda r: r[0] == 200)
+        if status != 200:
+            resp_text = body.decode(errors="replace")
+            logger.warning("🔍 Swap build error %s: %s", status, resp_text[:200])
+            self._forget_quote(*quote_args)
+            return None, f"Swap: {resp_text[:80]}"
+        swap_data = orjson.loads(body)
+        
+        tx_base64 = swap_data.get("swapTransaction")
+        if not tx_base64:
+            return None, "No transaction"
+        return tx_base64, ""
+    
+    async def _send_swap(self, tx_base64: str) -> str:
+        """Sign and submit through CDP; returns the transaction signature"""
+        # Correct signature: send_transaction(network, transaction, idempotency_key)
+        # tx_base64 goes to CDP exactly as Jupiter encoded it - no decode/re-encode
+        idempotency_key = str(uuid.uuid4())
+        send = self.solana_client.send_transaction
+        if asyncio.iscoroutinefunction(send):
+            tx_result = await send("solana", tx_base64, idempotency_key)
+        else:
+            # A synchronous client would block the event loop for the whole RPC
+            tx_result = await asyncio.to_thread(send, "solana", tx_base64, idempotency_key)
+        
+        if asyncio.iscoroutine(tx_result):
+            tx_result = await tx_result
+        
+        if isinstance(tx_result, dict):
+            return tx_result.get("signature", tx_result.get("hash", str(tx_result)))
+        
+        # The SDK returns the same result type every time, so find the field once
+        if self.tx_hash_attr is None:
+            self.tx_hash_attr = next(
+                (attr for attr in ("signature", "transaction_hash") if hasattr(tx_result, attr)), ""
+            )
+        if self.tx_hash_attr:
+            return getattr(tx_result, self.tx_hash_attr)
+        return str(tx_result)
 
 dex_trader = DexTrader()
@@ -0,0 +1,22 @@
+import aiohttp
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_session = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Keep-alive session shared by the scanner, safety and sync services, so
+    repeat calls skip the TCP/TLS handshake. DexTrader keeps its own,
+    separately limited pool for the trade path.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    return _session
+
+async def close():
+    if _session and not _session.closed:
+        await _session.close()
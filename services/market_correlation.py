@@ -1,5 +1,7 @@
 import aiohttp
+import orjson
 from datetime import datetime, timezone
+from services import http_client
 
 class MarketCorrelation:
     def __init__(self):
@@ -11,14 +13,14 @@ class MarketCorrelation:
         if self.last_check and (datetime.now(timezone.utc) - self.last_check).seconds < 60:
             return self._get_result()
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,solana&vs_currencies=usd&include_24hr_change=true"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.btc_data = {"change_24h": data.get("bitcoin", {}).get("usd_24h_change", 0)}
-                        self.sol_data = {"change_24h": data.get("solana", {}).get("usd_24h_change", 0), "change_1h": 0}
-                        self.last_check = datetime.now(timezone.utc)
+            session = await http_client.get_session()
+            url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,solana&vs_currencies=usd&include_24hr_change=true"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    data = orjson.loads(await resp.read())
+                    self.btc_data = {"change_24h": data.get("bitcoin", {}).get("usd_24h_change", 0)}
+                    self.sol_data = {"change_24h": data.get("solana", {}).get("usd_24h_change", 0), "change_1h": 0}
+                    self.last_check = datetime.now(timezone.utc)
         except:
             pass
         return self._get_result()
@@ -1,7 +1,11 @@
 import aiohttp
+import orjson
 import asyncio
+import logging
 from datetime import datetime, timezone
 
+logger = logging.getLogger(__name__)
+
 class SignalSources:
     def __init__(self):
         self.session = None
@@ -32,7 +36,7 @@ class SignalSources:
                 seen[contract] = s
         
         unique = list(seen.values())
-        print(f"📊 {len(unique)} unique signals")
+        logger.info("📊 %d unique signals", len(unique))
         return unique
     
     async def get_dexscreener_gainers(self) -> list:
@@ -45,7 +49,7 @@ class SignalSources:
             url = "https://api.dexscreener.com/token-profiles/latest/v1"
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     
                     solana_tokens = [t for t in data if t.get("chainId") == "solana"][:30]
                     
@@ -60,7 +64,7 @@ class SignalSources:
                             signals.append(pair_data)
                             
         except Exception as e:
-            print(f"Gainers error: {e}")
+            logger.warning("Gainers error: %s", e)
         
         return signals[:10]
     
@@ -77,7 +81,7 @@ class SignalSources:
                 url = f"https://api.dexscreener.com/latest/dex/search?q={search}"
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = orjson.loads(await resp.read())
                         pairs = data.get("pairs", [])
                         
                         for pair in pairs[:20]:
@@ -89,7 +93,7 @@ class SignalSources:
                                 signals.append(pair_data)
                                 
         except Exception as e:
-            print(f"New pairs error: {e}")
+            logger.warning("New pairs error: %s", e)
         
         return signals[:10]
     
@@ -106,7 +110,7 @@ class SignalSources:
                 url = f"https://api.dexscreener.com/latest/dex/search?q={search}"
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = orjson.loads(await resp.read())
                         pairs = data.get("pairs", [])
                         
                         for pair in pairs[:20]:
@@ -118,7 +122,7 @@ class SignalSources:
                                 signals.append(pair_data)
                                 
         except Exception as e:
-            print(f"Volume leaders error: {e}")
+            logger.warning("Volume leaders error: %s", e)
         
         return signals[:10]
     
@@ -130,7 +134,7 @@ class SignalSources:
             url = f"https://api.dexscreener.com/latest/dex/tokens/{contract}"
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     pairs = data.get("pairs", [])
                     
                     # Find best Solana pair
@@ -1,11 +1,16 @@
 import aiohttp
+import orjson
 import asyncio
+import logging
 from datetime import datetime, timezone
 
+logger = logging.getLogger(__name__)
+
 class SignalAggregator:
     def __init__(self):
         self.session = None
         self.token_cache = {}
+        self.details_semaphore = asyncio.Semaphore(10)
     
     async def get_session(self):
         if self.session is None or self.session.closed:
@@ -26,7 +31,7 @@ class SignalAggregator:
             url = f"https://api.dexscreener.com/latest/dex/search?q={symbol}"
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status == 200:
-                    result = await resp.json()
+                    result = orjson.loads(await resp.read())
                     pairs = result.get("pairs") or []
                     
                     for pair in pairs:
@@ -59,9 +64,19 @@ class SignalAggregator:
                 signals.extend(result)
         
         # Enrich signals with market data
+        async def fetch_details(coin: str) -> dict:
+            async with self.details_semaphore:
+                return await self.get_token_details(coin)
+        
+        all_details = await asyncio.gather(
+            *(fetch_details(signal["coin"]) for signal in signals),
+            return_exceptions=True
+        )
+        
         enriched = []
-        for signal in signals:
-            details = await self.get_token_details(signal["coin"])
+        for signal, details in zip(signals, all_details):
+            if isinstance(details, Exception):
+                continue
             signal.update({
                 "market_cap": details.get("market_cap", 0),
                 "liquidity": details.get("liquidity", 0),
@@ -85,7 +100,7 @@ class SignalAggregator:
             url = "https://api.coingecko.com/api/v3/search/trending"
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     for coin in data.get("coins", [])[:10]:
                         item = coin.get("item", {})
                         signals.append({
@@ -95,7 +110,7 @@ class SignalAggregator:
                             "timestamp": datetime.now(timezone.utc).isoformat()
                         })
         except Exception as e:
-            print(f"Gecko error: {e}")
+            logger.warning("Gecko error: %s", e)
         
         return signals
     
@@ -107,7 +122,7 @@ class SignalAggregator:
             url = "https://api.dexscreener.com/latest/dex/search?q=solana"
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     pairs = data.get("pairs") or []
                     
                     for pair in pairs[:30]:
@@ -123,6 +138,6 @@ class SignalAggregator:
                                     "timestamp": datetime.now(timezone.utc).isoformat()
                                 })
         except Exception as e:
-            print(f"DexScreener error: {e}")
+            logger.warning("DexScreener error: %s", e)
         
         return signals
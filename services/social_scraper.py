@@ -1,9 +1,13 @@
 import asyncio
 import aiohttp
+import logging
+import orjson
 import re
 from datetime import datetime, timezone
 from config import settings
 
+logger = logging.getLogger(__name__)
+
 class SocialScraper:
     def __init__(self):
         self.session = None
@@ -44,7 +48,7 @@ class SocialScraper:
                 seen[coin] = m
         
         final = list(seen.values())
-        print(f"📊 {len(final)} unique signals")
+        logger.info("📊 %d unique signals", len(final))
         return final
     
     async def scrape_dexscreener_new(self) -> list:
@@ -56,7 +60,7 @@ class SocialScraper:
                 async with session.get(f"https://api.dexscreener.com/latest/dex/pairs/{chain}", timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status != 200:
                         continue
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     
                     for pair in data.get("pairs", [])[:50]:
                         symbol = pair.get("baseToken", {}).get("symbol", "").upper()
@@ -87,7 +91,7 @@ class SocialScraper:
         try:
             async with session.get("https://api.dexscreener.com/token-boosts/top/v1", timeout=aiohttp.ClientTimeout(total=10)) as resp:
                 if resp.status == 200:
-                    tokens = await resp.json()
+                    tokens = orjson.loads(await resp.read())
                     for i, token in enumerate(tokens[:20] if isinstance(tokens, list) else []):
                         symbol = token.get("tokenSymbol", "").upper()
                         if symbol:
@@ -111,7 +115,7 @@ class SocialScraper:
                 async with session.get(f"https://api.geckoterminal.com/api/v2/networks/{network}/new_pools", timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status != 200:
                         continue
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     
                     for pool in data.get("data", [])[:15]:
                         attrs = pool.get("attributes", {})
@@ -142,7 +146,7 @@ class SocialScraper:
                 timeout=aiohttp.ClientTimeout(total=10)
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     for token in data.get("data", {}).get("tokens", []):
                         symbol = token.get("symbol", "").upper()
                         change = float(token.get("v24hChangePercent") or 0)
@@ -175,7 +179,7 @@ class SocialScraper:
                 ) as resp:
                     if resp.status != 200:
                         continue
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     
                     for post in data.get("data", {}).get("children", []):
                         pd = post.get("data", {})
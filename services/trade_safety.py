@@ -1,5 +1,5 @@
-import aiohttp
 from typing import Dict
+from services.dex_trader import dex_trader, usdc_to_raw, USDC_MINT, BUY_SLIPPAGE_BPS
 
 class TradeSafety:
     """
@@ -23,27 +23,24 @@ class TradeSafety:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get quote from Jupiter
-                amount_raw = int(amount_usd * 1e6)  # USDC decimals
-                url = f"https://public.jupiterapi.com/quote?inputMint=EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v&outputMint={contract}&amount={amount_raw}&slippageBps=100"
+            # Same quote the buy will use (price impact doesn't depend on slippageBps),
+            # so the swap picks it up from DexTrader's quote cache instead of re-quoting
+            amount_raw = usdc_to_raw(amount_usd)
+            status, data, _ = await dex_trader.get_quote(USDC_MINT, contract, amount_raw, BUY_SLIPPAGE_BPS)
+            
+            if status == 200:
+                price_impact = float(data.get("priceImpactPct", 0) or 0)
+                result["slippage_percent"] = abs(price_impact)
                 
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        
-                        price_impact = float(data.get("priceImpactPct", 0) or 0)
-                        result["slippage_percent"] = abs(price_impact)
-                        
-                        # Warn if slippage > 2%
-                        if abs(price_impact) > 2:
-                            result["safe"] = False
-                            result["warning"] = f"High slippage: {price_impact:.1f}%"
-                        
-                        # Check if route exists
-                        if not data.get("outAmount"):
-                            result["safe"] = False
-                            result["warning"] = "No route found"
+                # Warn if slippage > 2%
+                if abs(price_impact) > 2:
+                    result["safe"] = False
+                    result["warning"] = f"High slippage: {price_impact:.1f}%"
+                
+                # Check if route exists
+                if not data.get("outAmount"):
+                    result["safe"] = False
+                    result["warning"] = "No route found"
         except Exception as e:
             result["warning"] = f"Quote failed: {str(e)[:50]}"
         
@@ -1,4 +1,8 @@
 import aiohttp
+import asyncio
+import heapq
+import logging
+import orjson
 import os
 from datetime import datetime, timezone
 from config import settings
@@ -16,6 +20,14 @@ from services.tx_simulator import tx_simulator
 from services.trade_safety import trade_safety
 from services.portfolio_monitor import portfolio_monitor
 
+logger = logging.getLogger(__name__)
+
+DEGEN_SOURCES = frozenset(["pumpfun_new", "pumpfun_graduating"])
+
+# DexScreener lookups run every tick; build the timeouts once
+TOKEN_DATA_TIMEOUT = aiohttp.ClientTimeout(total=15)
+LIVE_PRICE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 class Trader:
     def __init__(self, db: Database):
         self.db = db
@@ -51,10 +63,10 @@ class Trader:
         try:
             async with session.get(
                 f"https://api.dexscreener.com/latest/dex/search?q={coin}",
-                timeout=aiohttp.ClientTimeout(total=15)
+                timeout=TOKEN_DATA_TIMEOUT
             ) as resp:
                 if resp.status == 200:
-                    result = await resp.json()
+                    result = orjson.loads(await resp.read())
                     pairs = result.get("pairs", [])
                     
                     best_pair = None
@@ -86,7 +98,7 @@ class Trader:
                         data["contract_address"] = best_pair.get("baseToken", {}).get("address")
                         data["chain"] = best_pair.get("chainId")
         except Exception as e:
-            print(f"Token data error for {coin}: {e}")
+            logger.warning("Token data error for %s: %s", coin, e)
         
         self.token_data_cache[coin] = {"data": data, "timestamp": datetime.now(timezone.utc)}
         return data
@@ -95,9 +107,17 @@ class Trader:
         data = await self.get_token_data(coin)
         return data["price"]
     
+    async def get_prices_bulk(self, coins: list) -> dict:
+        """Prices for many coins at once: one concurrent fetch per uncached coin"""
+        unique = list(dict.fromkeys(c.upper().strip() for c in coins))
+        results = await asyncio.gather(*(self.get_token_data(c) for c in unique), return_exceptions=True)
+        return {
+            coin: 0 if isinstance(data, Exception) else data["price"]
+            for coin, data in zip(unique, results)
+        }
+    
     def is_degen_signal(self, signal: dict) -> bool:
-        source = signal.get("source", "")
-        return source in ["pumpfun_new", "pumpfun_graduating"]
+        return signal.get("source", "") in DEGEN_SOURCES
     
     async def is_good_buy_safe(self, coin: str, signal: dict, data: dict, contract: str) -> tuple:
         if data["market_cap"] < settings.min_market_cap:
@@ -118,22 +138,27 @@ class Trader:
             return False, f"Weak buys ({buy_ratio:.0%})"
         
         if contract:
-            safety = await check_token_safety(contract)
+            # The four on-chain checks are independent: run them together and
+            # then judge them in the usual order, so rejection reasons don't change
+            safety, age_hours, sim, dev_check = await asyncio.gather(
+                check_token_safety(contract),
+                get_token_age_hours(contract),
+                tx_simulator.can_sell_token(contract, dex_trader.solana_address or ""),
+                dev_tracker.is_dev_selling(contract)
+            )
+            
             if not safety["safe"]:
                 reasons = ", ".join(safety["reasons"][:2])
                 return False, f"Safety: {reasons}"
             
-            age_hours = await get_token_age_hours(contract)
             if age_hours < 1:
                 return False, f"Too new ({age_hours:.1f}h)"
             if age_hours > 168:
                 return False, f"Too old ({age_hours/24:.0f}d)"
             
-            sim = await tx_simulator.can_sell_token(contract, dex_trader.solana_address or "")
             if not sim["can_sell"]:
                 return False, f"Honeypot: {sim['error']}"
             
-            dev_check = await dev_tracker.is_dev_selling(contract)
             if dev_check["is_selling"]:
                 return False, "Dev selling!"
         
@@ -356,18 +381,17 @@ class Trader:
         return {"should_sell": False, "reason": ""}
     
     async def get_degen_exposure(self, positions: list) -> float:
-        total = 0
-        for pos in positions:
-            if pos.get("is_degen", False):
-                price = await self.get_current_price(pos["coin"])
-                total += price * pos.get("quantity", 0)
-        return total
+        degen = [pos for pos in positions if pos.get("is_degen", False)]
+        if not degen:
+            return 0
+        prices = await self.get_prices_bulk([pos["coin"] for pos in degen])
+        return sum(prices[pos["coin"].upper().strip()] * pos.get("quantity", 0) for pos in degen)
     
     async def process_signals(self, signals: list):
         if not settings.trading_enabled:
             return
         if settings.is_daily_loss_limit_hit():
-            print("⚠️ Daily loss limit - pausing")
+            logger.warning("⚠️ Daily loss limit - pausing")
             await alert_service.alert_warning("Daily loss limit hit")
             return
         
@@ -377,25 +401,27 @@ class Trader:
         
         market = await market_correlation.check_market_conditions()
         if not market["safe_to_buy"]:
-            print(f"⚠️ Market: {market['warning']}")
+            logger.info("⚠️ Market: %s", market["warning"])
             return
         
-        await whale_tracker.scan_whale_activity()
+        # Independent reads: whale scan and wallet balances
+        _, balances = await asyncio.gather(
+            whale_tracker.scan_whale_activity(),
+            dex_trader.get_balances()
+        )
         
         available_usdc = 0
         if dex_trader.initialized:
-            balances = await dex_trader.get_balances()
             available_usdc = balances.get("usdc", 0)
-            print(f"💰 ${available_usdc:.2f} | BTC:{market['btc_change_24h']:+.1f}% SOL:{market['sol_change_1h']:+.1f}%")
+            logger.info("💰 $%.2f | BTC:%+.1f%% SOL:%+.1f%%", available_usdc, market["btc_change_24h"], market["sol_change_1h"])
         
         # Check portfolio health
-        balances = await dex_trader.get_balances()
         positions_value = sum(pos.get("buy_price", 0) * pos.get("quantity", 0) for pos in positions)
         health = await portfolio_monitor.check_health(balances.get("sol", 0), available_usdc, positions_value)
         
         if health["should_pause_trading"]:
             for warning in health["warnings"]:
-                print(warning)
+                logger.warning(warning)
             return
         
         if available_usdc < 0.50:
@@ -411,28 +437,29 @@ class Trader:
         pumpfun_signals = await pumpfun_scanner.get_all_signals() if settings.degen_enabled else []
         all_signals = signals + better_signals + pumpfun_signals
         
-        all_signals.sort(key=lambda x: x.get("signal_score", 0), reverse=True)
+        top_signals = heapq.nlargest(30, all_signals, key=lambda x: x.get("signal_score", 0))
+        
+        # Replaces a per-signal has_open_position() scan; the loop stops after one buy, so it can't go stale
+        held = {pos["coin"].upper() for pos in positions}
         
-        for signal in all_signals[:30]:
+        for signal in top_signals:
             coin = signal.get("coin", "").upper().strip()
-            if not coin:
+            if not coin or coin in held:
                 continue
             
             if settings.is_coin_blacklisted(coin):
                 continue
             if settings.is_coin_on_cooldown(coin):
                 continue
-            if await self.db.has_open_position(coin):
-                continue
             
             is_good, reason, signal_score, is_degen = await self.is_good_buy(coin, signal)
             
             if not is_good:
-                print(f"⛔ {coin}: {reason}")
+                logger.debug("⛔ %s: %s", coin, reason)
                 continue
             
             if is_degen and degen_budget < settings.degen_max_position_usd:
-                print(f"⛔ {coin}: Degen budget exhausted")
+                logger.debug("⛔ %s: Degen budget exhausted", coin)
                 continue
             
             data = await self.get_token_data(coin)
@@ -446,23 +473,23 @@ class Trader:
                 continue
             
             tier = "🎰 DEGEN" if is_degen else "✅ SAFE"
-            print(f"{tier} {coin} Score:{signal_score} | {reason}")
+            logger.info("%s %s Score:%s | %s", tier, coin, signal_score, reason)
             
             if settings.live_trading and dex_trader.initialized:
                 # Validate trade safety
                 safety = await trade_safety.validate_trade(contract, position_usd, is_buy=True)
                 if not safety["should_proceed"]:
-                    print(f"⛔ {coin}: Trade unsafe - {', '.join(safety['warnings'])}")
+                    logger.info("⛔ %s: Trade unsafe - %s", coin, ", ".join(safety["warnings"]))
                     continue
                 
-                print(f"🔄 BUY ${position_usd:.2f} {coin}")
+                logger.info("🔄 BUY $%.2f %s", position_usd, coin)
                 result = await dex_trader.swap_usdc_to_token(contract, position_usd)
                 
                 if not result["success"]:
-                    print(f"❌ Failed: {result['error']}")
+                    logger.error("❌ Failed: %s", result["error"])
                     continue
                 
-                print(f"✅ Bought!")
+                logger.info("✅ Bought %s", coin)
                 await alert_service.alert_buy(coin, position_usd, price, f"{tier} | {reason}")
             
             await self.db.open_position({
@@ -491,10 +518,10 @@ class Trader:
         try:
             async with session.get(
                 f"https://api.dexscreener.com/latest/dex/search?q={coin}",
-                timeout=aiohttp.ClientTimeout(total=10)
+                timeout=LIVE_PRICE_TIMEOUT
             ) as resp:
                 if resp.status == 200:
-                    result = await resp.json()
+                    result = orjson.loads(await resp.read())
                     for pair in result.get("pairs", []):
                         symbol = pair.get("baseToken", {}).get("symbol", "").upper()
                         if symbol == coin.upper() and pair.get("chainId") == target_chain:
@@ -514,12 +541,14 @@ class Trader:
         if not positions:
             return
         
-        for pos in positions:
+        # Price every position at once; the wallet is only read by a sell that fires
+        live_data = await asyncio.gather(*(self.get_live_price(pos["coin"]) for pos in positions))
+        
+        for pos, data in zip(positions, live_data):
             coin = pos["coin"]
             buy_price = pos["buy_price"]
             contract = pos.get("contract_address")
             
-            data = await self.get_live_price(coin)
             current_price = data["price"]
             
             if current_price == 0:
@@ -540,14 +569,14 @@ class Trader:
                 tier = "🎰" if is_degen else "📈"
                 
                 if settings.live_trading and dex_trader.initialized and contract:
-                    print(f"🔄 SELL {tier} {coin} {pnl_percent:+.1f}% - {decision['reason']}")
+                    logger.info("🔄 SELL %s %s %+.1f%% - %s", tier, coin, pnl_percent, decision["reason"])
                     result = await dex_trader.swap_token_to_usdc(contract)
                     
                     if not result["success"]:
-                        print(f"❌ Sell failed: {result['error']}")
+                        logger.error("❌ Sell failed: %s", result["error"])
                         continue
                     
-                    print(f"✅ Sold!")
+                    logger.info("✅ Sold %s", coin)
                     await alert_service.alert_sell(coin, pnl_percent, pnl_usd, decision["reason"])
                     
                     if pnl_percent > 0:
@@ -1,7 +1,23 @@
 import aiohttp
+import asyncio
+import logging
+import orjson
 import os
 from datetime import datetime, timezone
 from typing import List, Dict
+from services import http_client
+
+logger = logging.getLogger(__name__)
+
+# Stablecoins and wrapped SOL are never treated as tradeable holdings
+SKIPPED_MINTS = frozenset([
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # USDC
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT
+    "So11111111111111111111111111111111111111112",   # Wrapped SOL
+])
+
+# DexScreener's /tokens endpoint accepts up to 30 comma-separated addresses
+DEXSCREENER_BATCH = 30
 
 class WalletSync:
     def __init__(self):
@@ -13,72 +29,93 @@ class WalletSync:
         tokens = []
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Use Helius for reliable data
-                if self.helius_key:
-                    url = f"https://api.helius.xyz/v0/addresses/{wallet_address}/balances?api-key={self.helius_key}"
-                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
+            session = await http_client.get_session()
+            # Use Helius for reliable data
+            if self.helius_key:
+                url = f"https://api.helius.xyz/v0/addresses/{wallet_address}/balances?api-key={self.helius_key}"
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                    if resp.status == 200:
+                        data = orjson.loads(await resp.read())
+                        
+                        for token in data.get("tokens", []):
+                            address = token.get("mint", "")
+                            amount = float(token.get("amount", 0) or 0)
+                            decimals = token.get("decimals", 0)
                             
-                            for token in data.get("tokens", []):
-                                address = token.get("mint", "")
-                                amount = float(token.get("amount", 0) or 0)
-                                decimals = token.get("decimals", 0)
-                                
-                                # Adjust for decimals
-                                if decimals > 0:
-                                    amount = amount / (10 ** decimals)
-                                
-                                # Skip dust and stablecoins
-                                if amount <= 0:
-                                    continue
-                                if address in [
-                                    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # USDC
-                                    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # USDT
-                                    "So11111111111111111111111111111111111111112",   # Wrapped SOL
-                                ]:
-                                    continue
-                                
-                                tokens.append({
-                                    "contract_address": address,
-                                    "symbol": token.get("symbol", "UNKNOWN"),
-                                    "name": token.get("name", "Unknown"),
-                                    "amount": amount,
-                                    "decimals": decimals
-                                })
-                else:
-                    # Fallback to DexScreener token search
-                    print("No Helius key, using fallback")
-                    
+                            # Adjust for decimals
+                            if decimals > 0:
+                                amount = amount / (10 ** decimals)
+                            
+                            # Skip dust and stablecoins
+                            if amount <= 0:
+                                continue
+                            if address in SKIPPED_MINTS:
+                                continue
+                            
+                            tokens.append({
+                                "contract_address": address,
+                                "symbol": token.get("symbol", "UNKNOWN"),
+                                "name": token.get("name", "Unknown"),
+                                "amount": amount,
+                                "decimals": decimals
+                            })
+            else:
+                # Fallback to DexScreener token search
+                logger.warning("No Helius key, using fallback")
+                
         except Exception as e:
-            print(f"Wallet sync error: {e}")
+            logger.error("Wallet sync error: %s", e)
         
         return tokens
     
     async def get_token_value(self, contract_address: str) -> Dict:
         """Get current price and value for a token"""
-        result = {"price": 0, "value_usd": 0, "liquidity": 0, "symbol": ""}
+        values = await self.get_token_values([contract_address])
+        return values[contract_address]
+    
+    async def get_token_values(self, contract_addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Price/liquidity/symbol for many tokens, DEXSCREENER_BATCH addresses per
+        request instead of one request per token
+        """
+        values = {c: {"price": 0, "value_usd": 0, "liquidity": 0, "symbol": ""} for c in contract_addresses}
+        chunks = [
+            contract_addresses[i:i + DEXSCREENER_BATCH]
+            for i in range(0, len(contract_addresses), DEXSCREENER_BATCH)
+        ]
+        
+        async def fetch(session, chunk):
+            url = f"https://api.dexscreener.com/latest/dex/tokens/{','.join(chunk)}"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status != 200:
+                    return []
+                return orjson.loads(await resp.read()).get("pairs") or []
         
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://api.dexscreener.com/latest/dex/tokens/{contract_address}"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        pairs = data.get("pairs", [])
-                        
-                        if pairs:
-                            for pair in pairs:
-                                if pair.get("chainId") == "solana":
-                                    result["price"] = float(pair.get("priceUsd") or 0)
-                                    result["liquidity"] = float(pair.get("liquidity", {}).get("usd") or 0)
-                                    result["symbol"] = pair.get("baseToken", {}).get("symbol", "")
-                                    break
-        except:
-            pass
+            session = await http_client.get_session()
+            batches = await asyncio.gather(*(fetch(session, c) for c in chunks), return_exceptions=True)
+        except Exception as e:
+            logger.warning("Token value error: %s", e)
+            return values
+        
+        priced = set()
+        for pairs in batches:
+            if isinstance(pairs, BaseException):
+                continue
+            for pair in pairs:
+                if pair.get("chainId") != "solana":
+                    continue
+                contract = pair.get("baseToken", {}).get("address", "")
+                # First Solana pair per token wins
+                if contract not in values or contract in priced:
+                    continue
+                priced.add(contract)
+                result = values[contract]
+                result["price"] = float(pair.get("priceUsd") or 0)
+                result["liquidity"] = float(pair.get("liquidity", {}).get("usd") or 0)
+                result["symbol"] = pair.get("baseToken", {}).get("symbol", "")
         
-        return result
+        return values
     
     async def sync_positions(self, wallet_address: str, db) -> Dict:
         """Sync wallet with database"""
@@ -92,13 +129,12 @@ class WalletSync:
         db_positions = await db.get_open_positions()
         db_contracts = {p.get("contract_address", "").lower() for p in db_positions if p.get("contract_address")}
         
-        for token in wallet_tokens:
+        orphans = [t for t in wallet_tokens if t["contract_address"].lower() not in db_contracts]
+        token_values = await self.get_token_values([t["contract_address"] for t in orphans])
+        
+        for token in orphans:
             contract = token["contract_address"]
-            
-            if contract.lower() in db_contracts:
-                continue
-            
-            value_info = await self.get_token_value(contract)
+            value_info = token_values[contract]
             
             if value_info["price"] > 0:
                 value_usd = token["amount"] * value_info["price"]
@@ -113,7 +149,7 @@ class WalletSync:
                 })
                 results["total_orphan_value"] += value_usd
                 results["synced"] += 1
-                print(f"📥 Found orphan: {value_info['symbol']} ${value_usd:.2f}")
+                logger.info("📥 Found orphan: %s $%.2f", value_info["symbol"], value_usd)
         
         self.last_sync = datetime.now(timezone.utc)
         return results
@@ -1,6 +1,11 @@
 import aiohttp
+import logging
+import orjson
 import os
 from datetime import datetime, timezone, timedelta
+from services import http_client
+
+logger = logging.getLogger(__name__)
 
 # Known profitable Solana meme traders (public wallets from leaderboards)
 WHALE_WALLETS = [
@@ -23,11 +28,11 @@ class WhaleTracker:
         self.last_scan = datetime.now(timezone.utc)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                for wallet in WHALE_WALLETS[:5]:  # Limit to avoid rate limits
-                    await self._scan_wallet_transactions(session, wallet)
+            session = await http_client.get_session()
+            for wallet in WHALE_WALLETS[:5]:  # Limit to avoid rate limits
+                await self._scan_wallet_transactions(session, wallet)
         except Exception as e:
-            print(f"Whale scan error: {e}")
+            logger.warning("Whale scan error: %s", e)
         
         return self.recent_whale_buys
     
@@ -43,7 +48,7 @@ class WhaleTracker:
             
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     txns = data if isinstance(data, list) else data.get("data", [])
                     
                     for tx in txns: